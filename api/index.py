@@ -0,0 +1,59 @@
+"""Vercel serverless entry point.
+
+Serves the landing and health endpoints both as a WSGI callable (``app``)
+and as a ``BaseHTTPRequestHandler`` (``handler``) for the Vercel Python
+runtime.
+"""
+import json
+import sys
+from http.server import BaseHTTPRequestHandler
+
+
+def _route(path):
+    if path == "/health":
+        return 200, {"status": "ok"}
+    if path == "/":
+        return 200, {"message": "Home Finance Tracker API", "status": "running"}
+    return 404, {"detail": "Not Found"}
+
+
+def app(environ, start_response):
+    status_code, payload = _route(environ.get("PATH_INFO", "/"))
+    body = json.dumps(payload).encode()
+    reason = {200: "OK", 404: "Not Found"}[status_code]
+    start_response(
+        f"{status_code} {reason}",
+        [("Content-Type", "application/json"), ("Content-Length", str(len(body)))],
+    )
+    return [body]
+
+
+class handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        status_code, payload = _route(self.path.split("?")[0])
+        body = json.dumps(payload).encode()
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+# Warm the app while the module imports — that work happens inside the
+# already-billed cold-boot window instead of the first real request.
+_warm_ran = False
+try:
+    from io import BytesIO
+
+    _warm_env = {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": "/health",
+        "QUERY_STRING": "",
+        "wsgi.input": BytesIO(),
+        "wsgi.errors": sys.stderr,
+        "wsgi.url_scheme": "http",
+    }
+    list(app(_warm_env, lambda status, headers: None))
+    _warm_ran = True
+except Exception:
+    pass
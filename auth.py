@@ -0,0 +1,51 @@
+"""Password hashing and access-token handling for the finance tracker."""
+import base64
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import time
+from typing import Optional
+
+
+class AuthManager:
+    def __init__(self):
+        self.secret_key = os.getenv("SECRET_KEY", "change-me-in-production")
+        self.token_ttl = int(os.getenv("TOKEN_TTL_SECONDS", "86400"))
+
+    def hash_password(self, password: str) -> str:
+        salt = secrets.token_hex(16)
+        digest = hashlib.pbkdf2_hmac("sha256", password.encode(), salt.encode(), 100_000)
+        return f"{salt}${digest.hex()}"
+
+    def verify_password(self, password: str, hashed: str) -> bool:
+        try:
+            salt, digest = hashed.split("$", 1)
+        except ValueError:
+            return False
+        candidate = hashlib.pbkdf2_hmac("sha256", password.encode(), salt.encode(), 100_000)
+        return hmac.compare_digest(candidate.hex(), digest)
+
+    def create_access_token(self, username: str) -> str:
+        payload = {"sub": username, "exp": int(time.time()) + self.token_ttl}
+        raw = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+        signature = hmac.new(self.secret_key.encode(), raw.encode(), hashlib.sha256).hexdigest()
+        return f"{raw}.{signature}"
+
+    def decode_access_token(self, token: str) -> Optional[str]:
+        try:
+            raw, signature = token.rsplit(".", 1)
+        except ValueError:
+            return None
+        expected = hmac.new(self.secret_key.encode(), raw.encode(), hashlib.sha256).hexdigest()
+        if not hmac.compare_digest(signature, expected):
+            return None
+        padded = raw + "=" * (-len(raw) % 4)
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(padded))
+        except (ValueError, json.JSONDecodeError):
+            return None
+        if payload.get("exp", 0) < time.time():
+            return None
+        return payload.get("sub")
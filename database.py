@@ -0,0 +1,917 @@
+"""MongoDB access layer for the home finance tracker."""
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from dotenv import load_dotenv
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import PyMongoError
+
+from auth import AuthManager
+from models import Contribution, Home, JoinRequest, Transfer, User, UserInDB
+
+env_path = Path(__file__).parent / ".env"
+load_dotenv(env_path)
+
+logger = logging.getLogger(__name__)
+
+# Read once at import so constructing a Database never re-parses the
+# environment.
+MONGODB_URL = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
+DATABASE_NAME = os.getenv("DATABASE_NAME", "house_finance_tracker")
+
+# Analytics results are cached briefly because dashboards poll far more often
+# than contributions are written.
+ANALYTICS_CACHE_TTL = 15.0
+
+# Home docs are re-read several times within single handlers (membership and
+# leadership checks), so they get a seconds-level cache.
+HOME_CACHE_TTL = 2.0
+
+# Transfer legs are recorded as "Fund transfer"/"Fund received"
+# contributions; product analytics exclude them. Built once so every
+# pipeline shares the same anchored, case-sensitive pattern.
+_FUND_REGEX_MATCH = {"$not": {"$regex": "^Fund (transfer|received)", "$options": ""}}
+_PRODUCT_NOT_FUND = {"product_name": _FUND_REGEX_MATCH}
+
+
+
+
+def build_transfer_history_pipeline(match_field: str, username: str, lookup_field: str, name_field: str) -> list:
+    """Pipeline for one transfer direction: indexed match, newest-first sort,
+    then join the counterparty's full name.
+
+    $sort sits directly after $match so the per-direction
+    (username, date_created) index serves the top-K; inserting any stage
+    between them forces an in-memory sort.
+    """
+    return [
+        {"$match": {match_field: username}},
+        {"$sort": {"date_created": -1}},
+        {"$lookup": {
+            "from": "users",
+            "localField": lookup_field,
+            "foreignField": "username",
+            "as": "counterparty",
+            "pipeline": [{"$project": {"full_name": 1, "_id": 0}}],
+        }},
+        {"$unwind": {"path": "$counterparty", "preserveNullAndEmptyArrays": True}},
+        {"$addFields": {name_field: {"$ifNull": ["$counterparty.full_name", "Unknown"]}}},
+        {"$project": {"counterparty": 0}},
+    ]
+
+
+def _assert_match_sort_adjacency(pipeline: list):
+    """Assert nothing sits between a pipeline's leading $match and its $sort.
+
+    Used by the tests to keep index-backed top-K pipelines from regressing.
+    """
+    stages = [next(iter(stage)) for stage in pipeline]
+    if "$sort" not in stages:
+        return
+    match_index = stages.index("$match") if "$match" in stages else -1
+    sort_index = stages.index("$sort")
+    assert sort_index == match_index + 1, (
+        f"stage {stages[match_index + 1]!r} between $match and $sort breaks the index-backed sort"
+    )
+
+class Database:
+    __slots__ = ("client", "database", "auth_manager", "_analytics_cache", "_home_cache")
+
+    def __init__(self):
+        self.client = None
+        self.database = None
+        self.auth_manager = AuthManager()
+        self._analytics_cache: dict = {}
+        self._home_cache: dict = {}
+
+    async def connect_to_mongo(self):
+        try:
+            self.client = AsyncIOMotorClient(MONGODB_URL)
+            await self.client.admin.command("ping")
+            self.database = self.client[DATABASE_NAME]
+            safe_url = MONGODB_URL.split("@")[-1]
+            logger.info("Connected to MongoDB at %s", safe_url)
+            await self._ensure_indexes()
+        except Exception:
+            logger.exception("Could not connect to MongoDB")
+            raise
+
+    async def _ensure_indexes(self):
+        """Indexes backing the hot paths: contribution aggregations match on
+        (home_id, username) and sum amount, transfer history sorts per user by
+        date, pending join requests filter by (home_id, status)."""
+        db = self.database
+        await asyncio.gather(
+            db.contributions.create_index([("home_id", 1), ("username", 1), ("amount", 1)]),
+            db.contributions.create_index([("home_id", 1), ("date_created", 1)]),
+            db.transfers.create_index([("sender_username", 1), ("date_created", -1)]),
+            db.transfers.create_index([("recipient_username", 1), ("date_created", -1)]),
+            db.join_requests.create_index([("home_id", 1), ("status", 1), ("date_created", -1)]),
+            db.users.create_index([("username", 1)], unique=True),
+        )
+
+    async def close_mongo_connection(self):
+        if self.client is not None:
+            self.client.close()
+            logger.info("MongoDB connection closed")
+
+    @property
+    def db(self):
+        """The connected database. connect_to_mongo() must have run (the app
+        does this at startup); raising beats lazily reconnecting per call."""
+        if self.database is None:
+            raise RuntimeError("Database is not connected; call connect_to_mongo() first")
+        return self.database
+
+    # ------------------------------------------------------------------
+    # Users
+    # ------------------------------------------------------------------
+
+    async def create_user(self, user_data) -> UserInDB:
+        db = self.db
+        user_dict = {
+            "username": user_data.username,
+            "email": user_data.email,
+            "full_name": user_data.full_name,
+            "hashed_password": self.auth_manager.hash_password(user_data.password),
+            "date_created": datetime.now(timezone.utc),
+        }
+        result = await db.users.insert_one(user_dict)
+        return UserInDB(
+            id=str(result.inserted_id),
+            username=user_data.username,
+            email=user_data.email,
+            full_name=user_data.full_name,
+            hashed_password=user_dict["hashed_password"],
+        )
+
+    async def get_user(self, username: str) -> Optional[UserInDB]:
+        db = self.db
+        doc = await db.users.find_one({"username": username})
+        if doc is None:
+            return None
+        return UserInDB(
+            id=str(doc["_id"]),
+            username=doc["username"],
+            email=doc["email"],
+            full_name=doc["full_name"],
+            home_id=doc.get("home_id"),
+            total_contribution=doc.get("total_contribution", 0),
+            hashed_password=doc["hashed_password"],
+        )
+
+    async def get_all_users(self) -> List[UserInDB]:
+        db = self.db
+        docs = await db.users.find({}, {"hashed_password": 0}).sort("full_name", 1).to_list(length=None)
+        return [
+            UserInDB(
+                id=str(doc["_id"]),
+                username=doc["username"],
+                email=doc["email"],
+                full_name=doc["full_name"],
+                home_id=doc.get("home_id"),
+                hashed_password="",
+            )
+            for doc in docs
+        ]
+
+    async def get_all_users_brief(self) -> List[dict]:
+        """Just {username, full_name} per user — enough for selection lists,
+        without building a full model per row."""
+        db = self.db
+        cursor = db.users.find({}, {"username": 1, "full_name": 1, "_id": 0}).sort("full_name", 1)
+        return await cursor.to_list(length=None)
+
+    # ------------------------------------------------------------------
+    # Contributions
+    # ------------------------------------------------------------------
+
+    def _invalidate_analytics(self, home_id: Optional[str]):
+        """Drop cached analytics affected by a contribution write."""
+        self._analytics_cache.pop("global", None)
+        if home_id:
+            self._analytics_cache.pop(f"home:{home_id}", None)
+
+    async def _apply_total_delta(self, db, username: str, home_id: Optional[str], amount: float):
+        """Keep the denormalized running totals on the user and home docs in
+        step with a contribution write."""
+        updates = [db.users.update_one({"username": username}, {"$inc": {"total_contribution": amount}})]
+        if home_id:
+            updates.append(db.homes.update_one({"_id": ObjectId(home_id)}, {"$inc": {"home_total": amount}}))
+        await asyncio.gather(*updates)
+        self._invalidate_home(home_id)
+
+    async def refresh_home_totals(self, home_id: str):
+        """Rebuild the materialized per-(home, user) totals for one home.
+
+        $merge upserts into the home_user_totals collection so
+        analytics-heavy readers can look totals up by key instead of
+        re-aggregating contributions. Call after bulk imports or a
+        backfill; the per-write running totals cover the hot paths.
+        """
+        db = self.db
+        await db.contributions.aggregate([
+            {"$match": {"home_id": home_id}},
+            {"$group": {
+                "_id": {"home_id": "$home_id", "username": "$username"},
+                "total": {"$sum": "$amount"},
+            }},
+            {"$merge": {
+                "into": "home_user_totals",
+                "on": "_id",
+                "whenMatched": "replace",
+                "whenNotMatched": "insert",
+            }},
+        ]).to_list(length=None)
+
+    async def get_home_user_totals(self, home_id: str) -> dict:
+        """Read the materialized per-member totals for a home, keyed by
+        username. refresh_home_totals decides how fresh they are."""
+        docs = await self.db.home_user_totals.find({"_id.home_id": home_id}).to_list(length=None)
+        return {doc["_id"]["username"]: doc["total"] for doc in docs}
+
+    async def backfill_totals(self):
+        """One-time migration: seed the denormalized totals from the
+        contributions collection."""
+        db = self.db
+        per_user = await db.contributions.aggregate([
+            {"$group": {"_id": "$username", "total": {"$sum": "$amount"}}},
+        ]).to_list(length=None)
+        per_home = await db.contributions.aggregate([
+            {"$match": {"home_id": {"$ne": None}}},
+            {"$group": {"_id": "$home_id", "total": {"$sum": "$amount"}}},
+        ]).to_list(length=None)
+        await asyncio.gather(
+            *[db.users.update_one({"username": doc["_id"]}, {"$set": {"total_contribution": doc["total"]}})
+              for doc in per_user],
+            *[db.homes.update_one({"_id": ObjectId(doc["_id"])}, {"$set": {"home_total": doc["total"]}})
+              for doc in per_home],
+        )
+        self._home_cache.clear()
+
+    async def create_contribution(
+        self, username: str, contribution_data: dict, home_id: Optional[str] = None
+    ) -> Contribution:
+        db = self.db
+        if home_id is None:
+            # Back-compat path for callers that don't already hold the user.
+            user = await self.get_user(username)
+            if user is None:
+                raise ValueError("User not found")
+            home_id = user.home_id
+        contribution_dict = {
+            "username": username,
+            "home_id": home_id,
+            "product_name": contribution_data["product_name"],
+            "amount": contribution_data["amount"],
+            "description": contribution_data.get("description"),
+            "date_created": datetime.now(timezone.utc),
+        }
+        result = await db.contributions.insert_one(contribution_dict)
+        await self._apply_total_delta(db, username, home_id, contribution_dict["amount"])
+        self._invalidate_analytics(home_id)
+        return Contribution(id=str(result.inserted_id), **{k: v for k, v in contribution_dict.items()})
+
+    async def create_contributions_bulk(
+        self, username: str, home_id: Optional[str], items: List[dict]
+    ) -> List[Contribution]:
+        """Insert many contributions in one round-trip (bulk imports)."""
+        if not items:
+            return []
+        db = self.db
+        now = datetime.now(timezone.utc)
+        docs = [
+            {
+                "username": username,
+                "home_id": home_id,
+                "product_name": item["product_name"],
+                "amount": item["amount"],
+                "description": item.get("description"),
+                "date_created": now,
+            }
+            for item in items
+        ]
+        result = await db.contributions.insert_many(docs, ordered=False)
+        await self._apply_total_delta(db, username, home_id, sum(d["amount"] for d in docs))
+        self._invalidate_analytics(home_id)
+        return [
+            Contribution.model_construct(id=str(inserted_id), **doc)
+            for inserted_id, doc in zip(result.inserted_ids, docs)
+        ]
+
+    async def delete_contribution(self, contribution_id: str, username: str) -> bool:
+        db = self.db
+        doc = await db.contributions.find_one({"_id": ObjectId(contribution_id), "username": username})
+        if doc is None:
+            return False
+        await db.contributions.delete_one({"_id": ObjectId(contribution_id)})
+        await self._apply_total_delta(db, username, doc.get("home_id"), -doc["amount"])
+        self._invalidate_analytics(doc.get("home_id"))
+        return True
+
+    async def get_user_contributions(self, username: str) -> List[Contribution]:
+        db = self.db
+        docs = await db.contributions.find({"username": username}).sort("date_created", -1).to_list(length=None)
+        return [
+            Contribution(
+                id=str(doc["_id"]),
+                username=doc["username"],
+                home_id=doc.get("home_id"),
+                product_name=doc["product_name"],
+                amount=doc["amount"],
+                description=doc.get("description"),
+                date_created=doc.get("date_created"),
+            )
+            for doc in docs
+        ]
+
+    # ------------------------------------------------------------------
+    # Analytics
+    # ------------------------------------------------------------------
+
+    async def get_analytics(self) -> dict:
+        key = "global"
+        now = time.monotonic()
+        cached = self._analytics_cache.get(key)
+        if cached and now - cached[0] < ANALYTICS_CACHE_TTL:
+            return cached[1]
+
+        db = self.db
+        # Unfiltered headline number: collection metadata is enough, no scan.
+        total_contributions = await db.contributions.estimated_document_count()
+
+        # One scan fans out into both groupings instead of two full scans.
+        pipeline = [
+            {"$facet": {
+                "by_user": [
+                    {"$group": {"_id": "$username", "total_amount": {"$sum": "$amount"}, "count": {"$sum": 1}}},
+                    {"$lookup": {
+                        "from": "users",
+                        "localField": "_id",
+                        "foreignField": "username",
+                        "as": "user_info",
+                        "pipeline": [{"$project": {"full_name": 1, "_id": 0}}],
+                    }},
+                    {"$unwind": "$user_info"},
+                    {"$project": {"username": "$_id", "full_name": "$user_info.full_name", "total_amount": 1, "count": 1, "_id": 0}},
+                    {"$sort": {"total_amount": -1}},
+                ],
+                "by_product": [
+                    {"$match": _PRODUCT_NOT_FUND},
+                    {"$group": {"_id": "$product_name", "total_amount": {"$sum": "$amount"}, "count": {"$sum": 1}}},
+                    {"$sort": {"total_amount": -1}},
+                ],
+            }},
+        ]
+        facets = await db.contributions.aggregate(pipeline).to_list(1)
+        user_contributions = facets[0]["by_user"] if facets else []
+        product_contributions = facets[0]["by_product"] if facets else []
+
+        result = {
+            "total_contributions": total_contributions,
+            "total_amount": sum(u["total_amount"] for u in user_contributions),
+            "by_user": user_contributions,
+            "by_product": product_contributions,
+        }
+        self._analytics_cache[key] = (now, result)
+        return result
+
+    async def get_home_analytics(self, home_id: str) -> dict:
+        key = f"home:{home_id}"
+        now = time.monotonic()
+        cached = self._analytics_cache.get(key)
+        if cached and now - cached[0] < ANALYTICS_CACHE_TTL:
+            return cached[1]
+
+        db = self.db
+        total_contributions = await db.contributions.count_documents({"home_id": home_id})
+
+        # The indexed home match runs once; $facet fans the matching docs out
+        # into both groupings instead of two full scans.
+        pipeline = [
+            {"$match": {"home_id": home_id}},
+            {"$facet": {
+                "by_user": [
+                    {"$group": {"_id": "$username", "total_amount": {"$sum": "$amount"}, "count": {"$sum": 1}}},
+                    {"$lookup": {
+                        "from": "users",
+                        "localField": "_id",
+                        "foreignField": "username",
+                        "as": "user_info",
+                        "pipeline": [{"$project": {"full_name": 1, "_id": 0}}],
+                    }},
+                    {"$unwind": "$user_info"},
+                    {"$project": {"username": "$_id", "full_name": "$user_info.full_name", "total_amount": 1, "count": 1, "_id": 0}},
+                    {"$sort": {"total_amount": -1}},
+                ],
+                "by_product": [
+                    {"$match": _PRODUCT_NOT_FUND},
+                    {"$group": {"_id": "$product_name", "total_amount": {"$sum": "$amount"}, "count": {"$sum": 1}}},
+                    {"$sort": {"total_amount": -1}},
+                ],
+            }},
+        ]
+        facets = await db.contributions.aggregate(pipeline).to_list(1)
+        user_contributions = facets[0]["by_user"] if facets else []
+        product_contributions = facets[0]["by_product"] if facets else []
+
+        result = {
+            "total_contributions": total_contributions,
+            "total_amount": sum(u["total_amount"] for u in user_contributions),
+            "by_user": user_contributions,
+            "by_product": product_contributions,
+        }
+        self._analytics_cache[key] = (now, result)
+        return result
+
+    @staticmethod
+    def _month_range(year: int, month: int) -> tuple:
+        """Half-open [start, end) UTC datetime range covering one month."""
+        start = datetime(year, month, 1, tzinfo=timezone.utc)
+        if month == 12:
+            end = datetime(year + 1, 1, 1, tzinfo=timezone.utc)
+        else:
+            end = datetime(year, month + 1, 1, tzinfo=timezone.utc)
+        return start, end
+
+    async def get_monthly_summary(self, year: int, month: int) -> dict:
+        db = self.db
+        start, end = self._month_range(year, month)
+        match_condition = {"date_created": {"$gte": start, "$lt": end}}
+
+        user_pipeline = [
+            {"$match": match_condition},
+            # Group first so the lookup runs once per distinct user instead of
+            # once per contribution document.
+            {"$group": {"_id": "$username", "total_amount": {"$sum": "$amount"}, "count": {"$sum": 1}}},
+            {"$lookup": {
+                "from": "users",
+                "localField": "_id",
+                "foreignField": "username",
+                "as": "user_info",
+                "pipeline": [{"$project": {"full_name": 1, "_id": 0}}],
+            }},
+            {"$unwind": "$user_info"},
+            {"$project": {
+                "username": "$_id",
+                "full_name": "$user_info.full_name",
+                "total_amount": 1,
+                "count": 1,
+                "_id": 0,
+            }},
+            {"$sort": {"total_amount": -1}},
+        ]
+        user_summary = await db.contributions.aggregate(user_pipeline).to_list(length=None)
+
+        product_pipeline = [
+            # Two consecutive $match stages share match_condition without a
+            # dict copy; the server fuses them during pipeline optimization.
+            {"$match": match_condition},
+            {"$match": _PRODUCT_NOT_FUND},
+            {"$group": {"_id": "$product_name", "total_amount": {"$sum": "$amount"}, "count": {"$sum": 1}}},
+            {"$sort": {"total_amount": -1}},
+        ]
+        product_summary = await db.contributions.aggregate(product_pipeline).to_list(length=None)
+
+        return {"year": year, "month": month, "by_user": user_summary, "by_product": product_summary}
+
+    async def get_home_monthly_summary(self, home_id: str, year: int, month: int) -> dict:
+        db = self.db
+        start, end = self._month_range(year, month)
+        match_condition = {"home_id": home_id, "date_created": {"$gte": start, "$lt": end}}
+
+        user_pipeline = [
+            {"$match": match_condition},
+            # Group first so the lookup runs once per distinct user instead of
+            # once per contribution document.
+            {"$group": {"_id": "$username", "total_amount": {"$sum": "$amount"}, "count": {"$sum": 1}}},
+            {"$lookup": {
+                "from": "users",
+                "localField": "_id",
+                "foreignField": "username",
+                "as": "user_info",
+                "pipeline": [{"$project": {"full_name": 1, "_id": 0}}],
+            }},
+            {"$unwind": "$user_info"},
+            {"$project": {
+                "username": "$_id",
+                "full_name": "$user_info.full_name",
+                "total_amount": 1,
+                "count": 1,
+                "_id": 0,
+            }},
+            {"$sort": {"total_amount": -1}},
+        ]
+        user_summary = await db.contributions.aggregate(user_pipeline).to_list(length=None)
+
+        product_pipeline = [
+            # Two consecutive $match stages share match_condition without a
+            # dict copy; the server fuses them during pipeline optimization.
+            {"$match": match_condition},
+            {"$match": _PRODUCT_NOT_FUND},
+            {"$group": {"_id": "$product_name", "total_amount": {"$sum": "$amount"}, "count": {"$sum": 1}}},
+            {"$sort": {"total_amount": -1}},
+        ]
+        product_summary = await db.contributions.aggregate(product_pipeline).to_list(length=None)
+
+        return {"year": year, "month": month, "by_user": user_summary, "by_product": product_summary}
+
+    # ------------------------------------------------------------------
+    # Transfers
+    # ------------------------------------------------------------------
+
+    async def get_user_balance(self, username: str) -> float:
+        user = await self.get_user(username)
+        return user.total_contribution if user else 0
+
+    async def get_contribution_to_average(self, username: str) -> Optional[dict]:
+        try:
+            user = await self.get_user(username)
+            if user is None or not user.home_id:
+                return None
+            home = await self.get_home(user.home_id)
+            if home is None or not home.members:
+                return None
+
+            # The running totals are maintained on the user and home docs by
+            # _apply_total_delta, so no aggregation is needed here.
+            home_total = home.home_total
+            user_total = user.total_contribution
+
+            average = home_total / len(home.members)
+            return {
+                "username": username,
+                "user_total": user_total,
+                "home_total": home_total,
+                "average_contribution": average,
+                "difference": user_total - average,
+                "is_above_average": user_total >= average,
+            }
+        except PyMongoError as e:
+            logger.warning("get_contribution_to_average failed: %s", e)
+            return None
+
+    async def get_eligible_transfer_recipients(self, sender_username: str) -> List[dict]:
+        try:
+            db = self.db
+            sender = await self.get_user(sender_username)
+            if sender is None or not sender.home_id:
+                return []
+            home = await self.get_home(sender.home_id)
+            if home is None or not home.members:
+                return []
+            # New/empty homes have nothing to balance; skip the aggregation
+            # entirely (the running home total is already on the doc).
+            if home.home_total == 0:
+                return []
+
+            # One grouped scan yields every member's total; the home total is
+            # just their sum.
+            grouped = await db.contributions.aggregate([
+                {"$match": {"home_id": sender.home_id}},
+                {"$group": {"_id": "$username", "total": {"$sum": "$amount"}}},
+            ]).to_list(length=None)
+            totals = {doc["_id"]: doc["total"] for doc in grouped}
+            average = sum(totals.values()) / len(home.members)
+
+            eligible_usernames = [
+                username for username in home.members
+                if username != sender_username and totals.get(username, 0) < average
+            ]
+            if not eligible_usernames:
+                return []
+
+            name_docs = await db.users.find(
+                {"username": {"$in": eligible_usernames}},
+                {"username": 1, "full_name": 1},
+            ).to_list(length=None)
+            names = {doc["username"]: doc["full_name"] for doc in name_docs}
+
+            eligible = []
+            for username in eligible_usernames:
+                if username not in names:
+                    continue
+                user_total = totals.get(username, 0)
+                eligible.append({
+                    "username": username,
+                    "full_name": names[username],
+                    "total_contribution": user_total,
+                    "deficit": average - user_total,
+                })
+            return eligible
+        except PyMongoError as e:
+            logger.warning("get_eligible_transfer_recipients failed: %s", e)
+            return []
+
+    async def create_transfer(self, sender_username: str, transfer_data) -> Transfer:
+        db = self.db
+        sender, recipient = await asyncio.gather(
+            self.get_user(sender_username),
+            self.get_user(transfer_data.recipient_username),
+        )
+        if sender is None or recipient is None:
+            raise ValueError("Sender or recipient not found")
+        if sender.username == recipient.username:
+            raise ValueError("Cannot transfer to yourself")
+        if not sender.home_id or sender.home_id != recipient.home_id:
+            raise ValueError("Transfers are only allowed within the same home")
+        if transfer_data.amount <= 0:
+            raise ValueError("Transfer amount must be positive")
+
+        home = await self.get_home(sender.home_id)
+        if home is None or not home.members:
+            raise ValueError("Home not found")
+        # Validation is O(1): the running totals live on the docs just read.
+        average = home.home_total / len(home.members)
+        if sender.total_contribution < average:
+            raise ValueError("Only members above the average contribution can transfer funds")
+        if recipient.total_contribution >= average:
+            raise ValueError("Recipient is already at or above the average contribution")
+
+        # The two legs are independent inserts; overlap their round-trips.
+        await asyncio.gather(
+            self.create_contribution(sender_username, {
+                "product_name": "Fund transfer",
+                "amount": -transfer_data.amount,
+                "description": f"Transfer to {recipient.full_name}",
+            }, home_id=sender.home_id),
+            self.create_contribution(recipient.username, {
+                "product_name": "Fund received",
+                "amount": transfer_data.amount,
+                "description": f"Received from {sender.full_name}",
+            }, home_id=recipient.home_id),
+        )
+
+        transfer_dict = {
+            "sender_username": sender_username,
+            "recipient_username": recipient.username,
+            "amount": transfer_data.amount,
+            "description": transfer_data.description,
+            "date_created": datetime.now(timezone.utc),
+        }
+        result = await db.transfers.insert_one(transfer_dict)
+        return Transfer(id=str(result.inserted_id), **{k: v for k, v in transfer_dict.items()})
+
+    async def get_user_transfers(self, username: str) -> dict:
+        db = self.db
+
+        sent_pipeline = build_transfer_history_pipeline(
+            "sender_username", username, "recipient_username", "recipient_full_name"
+        )
+        received_pipeline = build_transfer_history_pipeline(
+            "recipient_username", username, "sender_username", "sender_full_name"
+        )
+        sent_docs = await db.transfers.aggregate(sent_pipeline).to_list(length=None)
+        received_docs = await db.transfers.aggregate(received_pipeline).to_list(length=None)
+
+        def _build(doc):
+            doc["id"] = str(doc.pop("_id"))
+            return Transfer(**doc)
+
+        return {
+            "sent": [_build(doc) for doc in sent_docs],
+            "received": [_build(doc) for doc in received_docs],
+        }
+
+    # ------------------------------------------------------------------
+    # Homes
+    # ------------------------------------------------------------------
+
+    async def create_home(self, username: str, home_data) -> Optional[Home]:
+        try:
+            db = self.db
+            home_dict = {
+                "name": home_data.name,
+                "leader_username": username,
+                "members": [username],
+                "date_created": datetime.now(timezone.utc),
+            }
+            result = await db.homes.insert_one(home_dict)
+            home_id = str(result.inserted_id)
+            await db.users.update_one({"username": username}, {"$set": {"home_id": home_id}})
+            return Home(id=home_id, **{k: v for k, v in home_dict.items()})
+        except PyMongoError as e:
+            logger.warning("create_home failed: %s", e)
+            return None
+
+    def _invalidate_home(self, home_id: Optional[str]):
+        if home_id:
+            self._home_cache.pop(home_id, None)
+
+    async def get_home(self, home_id: str) -> Optional[Home]:
+        try:
+            now = time.monotonic()
+            cached = self._home_cache.get(home_id)
+            if cached and now - cached[0] < HOME_CACHE_TTL:
+                return cached[1]
+            db = self.db
+            doc = await db.homes.find_one({"_id": ObjectId(home_id)})
+            if doc is None:
+                return None
+            home = Home(
+                id=str(doc["_id"]),
+                name=doc["name"],
+                leader_username=doc["leader_username"],
+                members=doc.get("members", []),
+                home_total=doc.get("home_total", 0),
+                date_created=doc.get("date_created"),
+            )
+            self._home_cache[home_id] = (now, home)
+            return home
+        except InvalidId:
+            return None
+        except PyMongoError as e:
+            logger.warning("get_home failed: %s", e)
+            return None
+
+    async def get_user_home(self, username: str) -> Optional[Home]:
+        user = await self.get_user(username)
+        if user is None or not user.home_id:
+            return None
+        return await self.get_home(user.home_id)
+
+    async def get_home_members(self, home_id: str) -> List[User]:
+        home = await self.get_home(home_id)
+        if home is None or not home.members:
+            return []
+        db = self.db
+        member_docs = await db.users.find(
+            {"username": {"$in": home.members}}, {"hashed_password": 0}
+        ).to_list(length=None)
+        by_name = {doc["username"]: doc for doc in member_docs}
+        # Preserve the membership order stored on the home doc.
+        return [
+            User(
+                id=str(by_name[username]["_id"]),
+                username=username,
+                email=by_name[username]["email"],
+                full_name=by_name[username]["full_name"],
+                home_id=by_name[username].get("home_id"),
+            )
+            for username in home.members
+            if username in by_name
+        ]
+
+    async def add_member_to_home(self, home_id: str, username: str) -> bool:
+        try:
+            db = self.db
+            await db.homes.update_one({"_id": ObjectId(home_id)}, {"$addToSet": {"members": username}})
+            await db.users.update_one({"username": username}, {"$set": {"home_id": home_id}})
+            self._invalidate_home(home_id)
+            return True
+        except (PyMongoError, InvalidId) as e:
+            logger.warning("add_member_to_home failed: %s", e)
+            return False
+
+    async def remove_member_from_home(self, home_id: str, username: str, leader_username: str) -> bool:
+        try:
+            db = self.db
+            home = await self.get_home(home_id)
+            if home is None or home.leader_username != leader_username:
+                return False
+            if username == leader_username:
+                return False
+            # The $pull on the home and the $unset on the user are independent.
+            await asyncio.gather(
+                db.homes.update_one({"_id": ObjectId(home_id)}, {"$pull": {"members": username}}),
+                db.users.update_one({"username": username}, {"$unset": {"home_id": ""}}),
+            )
+            self._invalidate_home(home_id)
+            return True
+        except (PyMongoError, InvalidId) as e:
+            logger.warning("remove_member_from_home failed: %s", e)
+            return False
+
+    async def leave_home(self, username: str) -> bool:
+        try:
+            db = self.db
+            user = await self.get_user(username)
+            if user is None or not user.home_id:
+                return False
+            home = await self.get_home(user.home_id)
+            if home is None:
+                return False
+            # The member pull and the user's home_id unset are independent;
+            # the delete only happens when the leader was the last member.
+            await asyncio.gather(
+                db.homes.update_one({"_id": ObjectId(user.home_id)}, {"$pull": {"members": username}}),
+                db.users.update_one({"username": username}, {"$unset": {"home_id": ""}}),
+            )
+            if home.leader_username == username and len(home.members) == 1:
+                await db.homes.delete_one({"_id": ObjectId(user.home_id)})
+            self._invalidate_home(user.home_id)
+            return True
+        except (PyMongoError, InvalidId) as e:
+            logger.warning("leave_home failed: %s", e)
+            return False
+
+    # ------------------------------------------------------------------
+    # Join requests
+    # ------------------------------------------------------------------
+
+    async def create_join_request(self, username: str, home_id: str) -> Optional[JoinRequest]:
+        try:
+            db = self.db
+            existing = await db.join_requests.find_one({
+                "username": username,
+                "home_id": home_id,
+                "status": "pending",
+            })
+            if existing is not None:
+                return None
+            request_dict = {
+                "username": username,
+                "home_id": home_id,
+                "status": "pending",
+                "date_created": datetime.now(timezone.utc),
+            }
+            result = await db.join_requests.insert_one(request_dict)
+            return JoinRequest(id=str(result.inserted_id), **{k: v for k, v in request_dict.items()})
+        except PyMongoError as e:
+            logger.warning("create_join_request failed: %s", e)
+            return None
+
+    async def get_pending_join_requests(self, home_id: str) -> List[dict]:
+        try:
+            db = self.db
+            pending = await db.join_requests.find(
+                {"home_id": home_id, "status": "pending"}
+            ).sort("date_created", -1).to_list(length=None)
+            if not pending:
+                return []
+            usernames = [doc["username"] for doc in pending]
+            user_docs = await db.users.find(
+                {"username": {"$in": usernames}},
+                {"username": 1, "full_name": 1, "email": 1},
+            ).to_list(length=None)
+            users_by_name = {doc["username"]: doc for doc in user_docs}
+            requests = []
+            for doc in pending:
+                user_doc = users_by_name.get(doc["username"])
+                requests.append({
+                    "id": str(doc["_id"]),
+                    "username": doc["username"],
+                    "full_name": user_doc["full_name"] if user_doc else "Unknown",
+                    "email": user_doc["email"] if user_doc else "",
+                    "date_created": doc.get("date_created"),
+                })
+            return requests
+        except PyMongoError as e:
+            logger.warning("get_pending_join_requests failed: %s", e)
+            return []
+
+    async def approve_join_request(self, request_id: str, leader_username: str) -> bool:
+        try:
+            db = self.db
+            request = await db.join_requests.find_one({"_id": ObjectId(request_id), "status": "pending"})
+            if request is None:
+                return False
+            home = await db.homes.find_one({"_id": ObjectId(request["home_id"])})
+            if home is None or home["leader_username"] != leader_username:
+                return False
+            # The three writes are independent once validated; one gather
+            # overlaps their round-trips.
+            await asyncio.gather(
+                db.users.update_one(
+                    {"username": request["username"]},
+                    {"$set": {"home_id": request["home_id"]}},
+                ),
+                db.homes.update_one(
+                    {"_id": ObjectId(request["home_id"])},
+                    {"$addToSet": {"members": request["username"]}},
+                ),
+                db.join_requests.update_one(
+                    {"_id": ObjectId(request_id)},
+                    {"$set": {"status": "approved", "date_processed": datetime.now(timezone.utc)}},
+                ),
+            )
+            self._invalidate_home(request["home_id"])
+            return True
+        except (PyMongoError, InvalidId) as e:
+            logger.warning("approve_join_request failed: %s", e)
+            return False
+
+    async def reject_join_request(self, request_id: str, leader_username: str) -> bool:
+        try:
+            db = self.db
+            request = await db.join_requests.find_one({"_id": ObjectId(request_id), "status": "pending"})
+            if request is None:
+                return False
+            home = await db.homes.find_one({"_id": ObjectId(request["home_id"])})
+            if home is None or home["leader_username"] != leader_username:
+                return False
+            await db.join_requests.update_one(
+                {"_id": ObjectId(request_id)},
+                {"$set": {"status": "rejected", "date_processed": datetime.now(timezone.utc)}},
+            )
+            return True
+        except (PyMongoError, InvalidId) as e:
+            logger.warning("reject_join_request failed: %s", e)
+            return False
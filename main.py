@@ -0,0 +1,241 @@
+"""FastAPI application for the home finance tracker."""
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from fastapi import Depends, FastAPI, Header, HTTPException
+
+from database import Database
+from models import (
+    ContributionCreate,
+    HomeCreate,
+    JoinRequestCreate,
+    LoginRequest,
+    TransferCreate,
+    UserCreate,
+    UserInDB,
+)
+
+db = Database()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await db.connect_to_mongo()
+    yield
+    await db.close_mongo_connection()
+
+
+app = FastAPI(title="Home Finance Tracker", lifespan=lifespan)
+
+
+async def get_current_user(authorization: Optional[str] = Header(None)) -> UserInDB:
+    if not authorization or not authorization.startswith("Bearer "):
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    username = db.auth_manager.decode_access_token(authorization.removeprefix("Bearer "))
+    if username is None:
+        raise HTTPException(status_code=401, detail="Invalid or expired token")
+    user = await db.get_user(username)
+    if user is None:
+        raise HTTPException(status_code=401, detail="User not found")
+    return user
+
+
+@app.get("/health")
+async def health():
+    return {"status": "ok"}
+
+
+@app.post("/register")
+async def register(user_data: UserCreate):
+    existing = await db.get_user(user_data.username)
+    if existing is not None:
+        raise HTTPException(status_code=400, detail="Username already registered")
+    user = await db.create_user(user_data)
+    return {"username": user.username, "full_name": user.full_name}
+
+
+@app.post("/login")
+async def login(credentials: LoginRequest):
+    user = await db.get_user(credentials.username)
+    if user is None or not db.auth_manager.verify_password(credentials.password, user.hashed_password):
+        raise HTTPException(status_code=401, detail="Invalid username or password")
+    token = db.auth_manager.create_access_token(user.username)
+    return {"access_token": token, "token_type": "bearer"}
+
+
+@app.get("/users/me")
+async def read_current_user(current_user: UserInDB = Depends(get_current_user)):
+    return {
+        "username": current_user.username,
+        "email": current_user.email,
+        "full_name": current_user.full_name,
+        "home_id": current_user.home_id,
+    }
+
+
+@app.get("/users")
+async def list_users(current_user: UserInDB = Depends(get_current_user)):
+    return await db.get_all_users_brief()
+
+
+@app.post("/contributions")
+async def create_contribution(
+    contribution: ContributionCreate,
+    current_user: UserInDB = Depends(get_current_user),
+):
+    created = await db.create_contribution(
+        current_user.username, contribution.model_dump(), home_id=current_user.home_id
+    )
+    return created
+
+
+@app.get("/contributions")
+async def list_contributions(current_user: UserInDB = Depends(get_current_user)):
+    return await db.get_user_contributions(current_user.username)
+
+
+@app.delete("/contributions/{contribution_id}")
+async def delete_contribution(
+    contribution_id: str,
+    current_user: UserInDB = Depends(get_current_user),
+):
+    deleted = await db.delete_contribution(contribution_id, current_user.username)
+    if not deleted:
+        raise HTTPException(status_code=404, detail="Contribution not found")
+    return {"deleted": True}
+
+
+@app.get("/analytics")
+async def analytics(current_user: UserInDB = Depends(get_current_user)):
+    return await db.get_analytics()
+
+
+@app.get("/analytics/home")
+async def home_analytics(current_user: UserInDB = Depends(get_current_user)):
+    if not current_user.home_id:
+        raise HTTPException(status_code=400, detail="You are not part of a home")
+    return await db.get_home_analytics(current_user.home_id)
+
+
+@app.get("/analytics/monthly")
+async def monthly_summary(year: int, month: int, current_user: UserInDB = Depends(get_current_user)):
+    return await db.get_monthly_summary(year, month)
+
+
+@app.get("/analytics/home/monthly")
+async def home_monthly_summary(
+    year: int,
+    month: int,
+    current_user: UserInDB = Depends(get_current_user),
+):
+    if not current_user.home_id:
+        raise HTTPException(status_code=400, detail="You are not part of a home")
+    return await db.get_home_monthly_summary(current_user.home_id, year, month)
+
+
+@app.get("/transfers")
+async def list_transfers(current_user: UserInDB = Depends(get_current_user)):
+    return await db.get_user_transfers(current_user.username)
+
+
+@app.post("/transfers")
+async def create_transfer(
+    transfer: TransferCreate,
+    current_user: UserInDB = Depends(get_current_user),
+):
+    try:
+        return await db.create_transfer(current_user.username, transfer)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.get("/transfers/recipients")
+async def eligible_recipients(current_user: UserInDB = Depends(get_current_user)):
+    return await db.get_eligible_transfer_recipients(current_user.username)
+
+
+@app.get("/transfers/average")
+async def contribution_to_average(current_user: UserInDB = Depends(get_current_user)):
+    stats = await db.get_contribution_to_average(current_user.username)
+    if stats is None:
+        raise HTTPException(status_code=400, detail="You are not part of a home")
+    return stats
+
+
+@app.post("/homes")
+async def create_home(home: HomeCreate, current_user: UserInDB = Depends(get_current_user)):
+    if current_user.home_id:
+        raise HTTPException(status_code=400, detail="You are already part of a home")
+    created = await db.create_home(current_user.username, home)
+    if created is None:
+        raise HTTPException(status_code=500, detail="Could not create home")
+    return created
+
+
+@app.get("/homes/mine")
+async def my_home(current_user: UserInDB = Depends(get_current_user)):
+    home = await db.get_user_home(current_user.username)
+    if home is None:
+        raise HTTPException(status_code=404, detail="You are not part of a home")
+    return home
+
+
+@app.get("/homes/members")
+async def home_members(current_user: UserInDB = Depends(get_current_user)):
+    if not current_user.home_id:
+        raise HTTPException(status_code=400, detail="You are not part of a home")
+    return await db.get_home_members(current_user.home_id)
+
+
+@app.post("/homes/leave")
+async def leave_home(current_user: UserInDB = Depends(get_current_user)):
+    left = await db.leave_home(current_user.username)
+    if not left:
+        raise HTTPException(status_code=400, detail="Could not leave home")
+    return {"left": True}
+
+
+@app.delete("/homes/members/{username}")
+async def remove_member(username: str, current_user: UserInDB = Depends(get_current_user)):
+    if not current_user.home_id:
+        raise HTTPException(status_code=400, detail="You are not part of a home")
+    removed = await db.remove_member_from_home(current_user.home_id, username, current_user.username)
+    if not removed:
+        raise HTTPException(status_code=400, detail="Could not remove member")
+    return {"removed": True}
+
+
+@app.post("/join-requests")
+async def create_join_request(
+    join_request: JoinRequestCreate,
+    current_user: UserInDB = Depends(get_current_user),
+):
+    if current_user.home_id:
+        raise HTTPException(status_code=400, detail="You are already part of a home")
+    created = await db.create_join_request(current_user.username, join_request.home_id)
+    if created is None:
+        raise HTTPException(status_code=400, detail="Join request already pending")
+    return created
+
+
+@app.get("/join-requests/pending")
+async def pending_join_requests(current_user: UserInDB = Depends(get_current_user)):
+    if not current_user.home_id:
+        raise HTTPException(status_code=400, detail="You are not part of a home")
+    return await db.get_pending_join_requests(current_user.home_id)
+
+
+@app.post("/join-requests/{request_id}/approve")
+async def approve_join_request(request_id: str, current_user: UserInDB = Depends(get_current_user)):
+    approved = await db.approve_join_request(request_id, current_user.username)
+    if not approved:
+        raise HTTPException(status_code=400, detail="Could not approve join request")
+    return {"approved": True}
+
+
+@app.post("/join-requests/{request_id}/reject")
+async def reject_join_request(request_id: str, current_user: UserInDB = Depends(get_current_user)):
+    rejected = await db.reject_join_request(request_id, current_user.username)
+    if not rejected:
+        raise HTTPException(status_code=400, detail="Could not reject join request")
+    return {"rejected": True}
@@ -0,0 +1,88 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class User(BaseModel):
+    id: Optional[str] = None
+    username: str
+    email: str
+    full_name: str
+    home_id: Optional[str] = None
+    total_contribution: float = 0
+
+
+class UserInDB(User):
+    hashed_password: str
+
+
+class UserCreate(BaseModel):
+    username: str
+    email: str
+    full_name: str
+    password: str
+
+
+class LoginRequest(BaseModel):
+    username: str
+    password: str
+
+
+class Contribution(BaseModel):
+    id: Optional[str] = None
+    username: str
+    home_id: Optional[str] = None
+    product_name: str
+    amount: float
+    description: Optional[str] = None
+    date_created: Optional[datetime] = None
+
+
+class ContributionCreate(BaseModel):
+    product_name: str
+    amount: float
+    description: Optional[str] = None
+
+
+class Transfer(BaseModel):
+    id: Optional[str] = None
+    sender_username: str
+    recipient_username: str
+    amount: float
+    description: Optional[str] = None
+    date_created: Optional[datetime] = None
+    sender_full_name: Optional[str] = None
+    recipient_full_name: Optional[str] = None
+
+
+class TransferCreate(BaseModel):
+    recipient_username: str
+    amount: float
+    description: Optional[str] = None
+
+
+class Home(BaseModel):
+    id: Optional[str] = None
+    name: str
+    leader_username: str
+    members: List[str] = []
+    home_total: float = 0
+    date_created: Optional[datetime] = None
+
+
+class HomeCreate(BaseModel):
+    name: str
+
+
+class JoinRequest(BaseModel):
+    id: Optional[str] = None
+    username: str
+    home_id: str
+    status: str = "pending"
+    date_created: Optional[datetime] = None
+    date_processed: Optional[datetime] = None
+
+
+class JoinRequestCreate(BaseModel):
+    home_id: str
@@ -0,0 +1,43 @@
+"""Pipeline-shape guards.
+
+The transfer history pipelines must keep $sort immediately after the
+indexed $match so the per-direction (username, date_created) indexes
+serve the top-K; a stage slipped in between silently degrades to an
+in-memory sort.
+"""
+import pytest
+
+import database
+
+_DIRECTIONS = [
+    ("sender_username", "recipient_username", "recipient_full_name"),
+    ("recipient_username", "sender_username", "sender_full_name"),
+]
+
+
+@pytest.mark.parametrize("match_field,lookup_field,name_field", _DIRECTIONS)
+def test_transfer_pipeline_match_sort_adjacency(match_field, lookup_field, name_field):
+    pipeline = database.build_transfer_history_pipeline(
+        match_field, "alice", lookup_field, name_field
+    )
+    database._assert_match_sort_adjacency(pipeline)
+
+
+@pytest.mark.parametrize("match_field,lookup_field,name_field", _DIRECTIONS)
+def test_transfer_pipeline_leads_with_indexed_match(match_field, lookup_field, name_field):
+    pipeline = database.build_transfer_history_pipeline(
+        match_field, "alice", lookup_field, name_field
+    )
+    stages = [next(iter(stage)) for stage in pipeline]
+    assert stages[:2] == ["$match", "$sort"]
+    assert pipeline[0]["$match"] == {match_field: "alice"}
+
+
+def test_adjacency_guard_rejects_interleaved_stage():
+    bad = [
+        {"$match": {"sender_username": "alice"}},
+        {"$project": {"amount": 1}},
+        {"$sort": {"date_created": -1}},
+    ]
+    with pytest.raises(AssertionError):
+        database._assert_match_sort_adjacency(bad)
@@ -0,0 +1,96 @@
+import importlib
+import io
+import os
+import sys
+from types import MappingProxyType
+
+# os.path is already loaded by the interpreter bootstrap; pathlib's import
+# graph is not worth paying for one directory hop.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+# Frozen template shared by every request; per-test environs are cheap
+# copies with only PATH_INFO rebound. Includes the wsgi.* keys PEP 3333
+# requires so the app never crashes on a missing wsgi.input.
+_BASE_ENV = MappingProxyType({
+    "REQUEST_METHOD": "GET",
+    "QUERY_STRING": "",
+    "SERVER_NAME": "test",
+    "SERVER_PORT": "80",
+    "SERVER_PROTOCOL": "HTTP/1.1",
+    "wsgi.version": (1, 0),
+    "wsgi.input": io.BytesIO(),
+    "wsgi.errors": sys.stderr,
+    "wsgi.url_scheme": "http",
+    "wsgi.multithread": False,
+    "wsgi.multiprocess": False,
+    "wsgi.run_once": True,
+})
+
+
+def _cached_import(module_name, attr=None):
+    """Return an already-imported module from sys.modules when possible, so
+    repeat lookups never re-run module-level initialization."""
+    module = sys.modules.get(module_name) or importlib.import_module(module_name)
+    return getattr(module, attr) if attr else module
+
+
+@pytest.fixture(scope="session")
+def api_index():
+    """Import api.index exactly once for the whole session."""
+    return _cached_import("api.index")
+
+
+@pytest.fixture
+def wsgi_env():
+    """Fresh mutable environ built from the frozen template; tests rebind
+    PATH_INFO (and nothing else) per request."""
+    return dict(_BASE_ENV)
+
+
+@pytest.fixture
+def capture_start_response():
+    """(start_response, captured) pair that records (status, headers)
+    instead of printing — no stdout lock or syscalls inside the request
+    loop."""
+    captured = []
+
+    def start_response(status, headers, exc_info=None):
+        captured.append((status, headers))
+        return lambda body: None
+
+    return start_response, captured
+
+
+@pytest.fixture(scope="session")
+def client(api_index):
+    """werkzeug test client bound to the WSGI app — builds the environ,
+    drains and closes the iterable, and parses the response for us, all
+    in-process with no socket."""
+    werkzeug_test = pytest.importorskip("werkzeug.test")
+    return werkzeug_test.Client(api_index.app)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _freeze_sys_modules():
+    """Snapshot sys.modules at session start and verify nothing replaced an
+    already-imported module. Keeping the cache stable is what makes
+    _cached_import O(1); a test that reloads modules behind our back would
+    silently re-pay imports (and can break module-level state)."""
+    baseline = dict(sys.modules)
+    yield
+    replaced = [
+        name for name, module in baseline.items()
+        if sys.modules.get(name) is not None and sys.modules.get(name) is not module
+    ]
+    assert not replaced, f"modules replaced during the test session: {replaced}"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup(api_index):
+    """Fire one synthetic request through the app before any test runs, so
+    lazy first-request work never lands inside a measured test."""
+    environ = dict(_BASE_ENV)
+    environ["PATH_INFO"] = "/"
+    api_index.app(environ, lambda status, headers: None)
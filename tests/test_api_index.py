@@ -0,0 +1,102 @@
+import os
+import sys
+
+import pytest
+
+# Same reasoning as conftest: os.path ships with the interpreter bootstrap,
+# so two dirname calls beat importing pathlib's whole class hierarchy.
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_api_index_discoverable():
+    """Verify the entry module resolves on sys.path without executing it —
+    find_spec only walks the finders, so a broken module body (or its warmup
+    side effect) can't mask a packaging problem here."""
+    from importlib.util import find_spec
+
+    assert find_spec("api.index") is not None
+
+
+def test_handler_is_baseclass(api_index):
+    # http.server drags in socketserver, email and mimetypes; only this test
+    # needs it, so keep it out of module import time.
+    from http.server import BaseHTTPRequestHandler
+
+    # issubclass raises TypeError for non-classes, covering the old
+    # isinstance(..., type) pre-check in one call.
+    try:
+        assert issubclass(api_index.handler, BaseHTTPRequestHandler)
+    except TypeError:
+        pytest.fail("api.index.handler is not a class")
+
+
+def test_wsgi_imports_cleanly():
+    """Run the import + one request in a fresh interpreter, mirroring a
+    Vercel cold start. Catches import-order bugs that hide when the test
+    session has already imported a side-effect module."""
+    import subprocess
+    import textwrap
+
+    source = textwrap.dedent("""
+        from api.index import app
+        body = b"".join(app(
+            {"REQUEST_METHOD": "GET", "PATH_INFO": "/", "QUERY_STRING": ""},
+            lambda status, headers: None,
+        ))
+        assert body
+    """)
+    subprocess.check_call([sys.executable, "-c", source], cwd=_REPO_ROOT)
+
+
+def test_module_warmup_ran(api_index):
+    assert api_index._warm_ran is True
+
+
+def test_import_time_budget():
+    """Importing api.index is on the critical path of every cold start;
+    fail if the whole import graph exceeds the budget."""
+    import subprocess
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import api.index"],
+        capture_output=True,
+        text=True,
+        cwd=_REPO_ROOT,
+    )
+    assert result.returncode == 0, result.stderr
+    total_us = 0
+    for line in result.stderr.splitlines():
+        # "import time:      self |     cumulative | module"
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        total_us += int(line.split("|")[0].removeprefix("import time:").strip())
+    assert total_us < 500_000, f"api.index imports took {total_us}us"
+
+
+@pytest.mark.parametrize("path", ["/", "/health"])
+def test_wsgi_routes(api_index, wsgi_env, capture_start_response, path):
+    wsgi_env["PATH_INFO"] = path
+
+    start_response, captured = capture_start_response
+    # PEP 3333: drain the iterable and close it so any resources it holds
+    # are released deterministically, not whenever GC runs.
+    iterable = api_index.app(wsgi_env, start_response)
+    try:
+        body = b"".join(iterable)
+    finally:
+        if hasattr(iterable, "close"):
+            iterable.close()
+    assert captured and captured[0][0].startswith("200")
+    assert body
+
+
+def test_health_via_client(client):
+    response = client.get("/health")
+    assert response.status_code == 200
+    assert response.get_json() == {"status": "ok"}
+
+
+if __name__ == "__main__":
+    # Route direct invocation through pytest's collector instead of
+    # re-implementing a runner; -x and --lf keep iteration cycles short.
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,22 @@
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.benchmark(group="wsgi")
+def test_wsgi_throughput(benchmark, api_index, wsgi_env):
+    """Baseline for the app() round-trip; compare runs with
+    --benchmark-autosave / --benchmark-compare to catch regressions."""
+    wsgi_env["PATH_INFO"] = "/health"
+    start_response = lambda status, headers: None
+
+    def run():
+        iterable = api_index.app(wsgi_env, start_response)
+        try:
+            return b"".join(iterable)
+        finally:
+            if hasattr(iterable, "close"):
+                iterable.close()
+
+    body = benchmark(run)
+    assert body